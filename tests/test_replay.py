@@ -0,0 +1,163 @@
+import pytest
+
+from typecli import consts
+from typecli.commands import Command, CommandLookup
+from typecli.replay import Entry, Recorder, Replayer, _percentile, load_session, save_session
+from typecli.types import Sentence
+
+# Stop the test run from ending in a REPL
+consts.BUILD_AND_RUN = False
+
+
+def stubs(**callbacks) -> CommandLookup:
+    lookup = CommandLookup()
+
+    for name, callback in callbacks.items():
+        lookup.append(Command(
+            name = name,
+            description = "Stub command.",
+            aliases = [name[0]],
+            callback = callback,
+            register = False
+        ))
+
+    return lookup
+
+
+def echo(text: Sentence, /) -> None:
+    print(text)
+
+
+def crash(text: Sentence, /) -> None:
+    raise RuntimeError(text)
+
+
+def test_stub_can_share_name_with_registered_command():
+    lookup = stubs(echo = echo)
+
+    assert Command.instances.get('echo') is not lookup['echo']
+
+
+def test_session_round_trip(tmp_path):
+    entries = [Entry(0.0, 'echo hi'), Entry(1.5, 'echo "two words"')]
+    path = str(tmp_path / 'session.jsonl')
+
+    save_session(entries, path)
+
+    assert load_session(path) == entries
+
+
+@pytest.mark.parametrize(('pct', 'expected'), [(0, 1), (50, 50), (99, 99), (100, 100)])
+def test_percentile_hundred(pct, expected):
+    assert _percentile([float(n) for n in range(1, 101)], pct) == expected
+
+
+@pytest.mark.parametrize(('size', 'pct', 'expected'), [(5, 50, 3), (5, 90, 5), (9, 50, 5), (9, 90, 9)])
+def test_percentile_odd_sizes(size, pct, expected):
+    assert _percentile([float(n) for n in range(1, size + 1)], pct) == expected
+
+
+@pytest.mark.parametrize('pct', [0, 50, 100])
+def test_percentile_single(pct):
+    assert _percentile([3.0], pct) == 3.0
+
+
+def test_speed_scales_pacing():
+    replayer = Replayer(stubs(echo = echo))
+    entries = [Entry(0.0, 'echo a'), Entry(0.2, 'echo b')]
+
+    assert replayer.replay(entries, speed = None).elapsed < 0.1
+    assert replayer.replay(entries, speed = 2.0).elapsed >= 0.1
+
+
+@pytest.mark.parametrize('speed', [0, -1.0])
+def test_non_positive_speed(speed):
+    with pytest.raises(ValueError):
+        Replayer(stubs(echo = echo)).replay([], speed = speed)
+
+
+def test_aliases_grouped_under_name():
+    report = Replayer(stubs(echo = echo)).replay(
+        [Entry(0.0, 'echo a'), Entry(0.0, 'e b'), Entry(0.0, '')],
+        speed = None
+    )
+
+    assert list(report.latencies) == ['echo']
+    assert report.total == 2
+
+
+def test_errors_counted_without_aborting(capsys):
+    report = Replayer(stubs(echo = echo, crash = crash)).replay(
+        [Entry(0.0, 'crash a'), Entry(0.0, 'echo b'), Entry(0.0, 'crash c')],
+        speed = None
+    )
+
+    assert report.total == 3
+    assert report.errors == {'crash': 2}
+    assert "2 errors" in str(report)
+    assert capsys.readouterr().out == ""
+
+
+def test_parser_errors_counted():
+    report = Replayer(stubs(echo = echo)).replay(
+        [Entry(0.0, 'missing a'), Entry(0.0, 'echo b')],
+        speed = None
+    )
+
+    assert report.errors == {'missing': 1}
+    assert report.total == 2
+
+
+def test_recorder_keeps_file_until_run(tmp_path, monkeypatch):
+    path = tmp_path / 'session.jsonl'
+    path.write_text('{"offset": 0.0, "line": "echo old"}\n')
+
+    recorder = Recorder(str(path), stubs(echo = echo))
+
+    assert load_session(str(path)) == [Entry(0.0, 'echo old')]
+
+    lines = iter(['echo new'])
+
+    def fake_input(_):
+        for line in lines:
+            return line
+        
+        raise EOFError
+
+    monkeypatch.setattr('builtins.input', fake_input)
+    recorder.run()
+
+    assert [entry.line for entry in load_session(str(path))] == ['echo new']
+
+
+def test_recorder_writes_as_it_goes(tmp_path, monkeypatch):
+    path = str(tmp_path / 'session.jsonl')
+    lines = iter(['echo a', '', 'crash b', 'echo c'])
+
+    monkeypatch.setattr('builtins.input', lambda _: next(lines))
+
+    recorder = Recorder(path, stubs(echo = echo, crash = crash))
+
+    with pytest.raises(RuntimeError):
+        recorder.run()
+
+    assert [entry.line for entry in load_session(path)] == ['echo a', 'crash b']
+
+
+def test_recorder_stops_on_eof(tmp_path, monkeypatch):
+    path = str(tmp_path / 'session.jsonl')
+    lines = iter(['echo a'])
+
+    def fake_input(_):
+        for line in lines:
+            return line
+        
+        raise EOFError
+
+    monkeypatch.setattr('builtins.input', fake_input)
+
+    recorder = Recorder(path, stubs(echo = echo))
+    recorder.run()
+
+    assert load_session(path) == recorder.entries
+    assert len(recorder.entries) == 1
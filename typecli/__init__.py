@@ -22,7 +22,7 @@ def _build_and_run():
         pass
 
     # Build the CLI
-    cli = CLI()
+    cli = CLI(record = consts.RECORD_SESSION)
 
     # Run the CLI
     cli.run()
\ No newline at end of file
@@ -1,9 +1,14 @@
 from .commands import Command, CommandLookup
 from .parser import Parser
+from .replay import Recorder
 
 class CLI:
-    def __init__(self) -> None:
+    def __init__(self, *, record: str | None = None) -> None:
         self._commands: CommandLookup = Command.instances
+        self._record = record
     
     def run(self) -> None:
-        Parser(self._commands).run()
\ No newline at end of file
+        if self._record:
+            Recorder(self._record, self._commands).run()
+        else:
+            Parser(self._commands).run()
\ No newline at end of file
@@ -83,14 +83,18 @@ class Command:
         name: str | None = None,
         description: str,
         aliases: list[str] = [],
-        callback: Func
+        callback: Func,
+        register: bool = True
     ) -> None:
         self.name = name
         self.description = description
         self.aliases = aliases
         self.callback = Callback(callback)
 
-        self.instances.append(self)
+        # Unregistered commands can be added to a separate
+        # lookup, like when stubbing out commands for a replay
+        if register:
+            self.instances.append(self)
     
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         self.callback(*args, **kwargs)
@@ -29,4 +29,15 @@ class consts(BuiltinType):
     A constant defining the default type of untyped arguments.
 
     This is usually `Word`, unless edited.
+    """
+
+    RECORD_SESSION: str | None = None
+    """
+    A constant defining the file that the automatically built `CLI` records its session to.
+
+    Every line entered is written to this file as it's entered, along with how long after
+    the start of the session it was entered. The file can then be replayed with a `Replayer`
+    from `typecli.replay`.
+
+    By default, this is `None`, meaning nothing is recorded.
     """
\ No newline at end of file
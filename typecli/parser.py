@@ -46,13 +46,18 @@ class Parser:
         
         return args
     
+    def error(self, message: str, /) -> None:
+        "Report a problem with the given input."
+
+        error(message)
+    
     def parse(self, tokens: list[str]) -> None:
         "Parse and run the given tokens."
 
         command = self._commands.get(tokens[0])
 
         if not command:
-            error(f"No command was found by the name '{tokens[0]}'.")
+            self.error(f"No command was found by the name '{tokens[0]}'.")
             return
         
         _parameter_lookup = {
@@ -86,22 +91,22 @@ class Parser:
                         
                         continue
                     else:
-                        error(f"No flag found with the name '{token}'.")
+                        self.error(f"No flag found with the name '{token}'.")
                 
                 if token != f"-{param.name}" and param.default is param.empty:
-                    error(f"Invalid parameter name '{token}': expected '-{param.name}'.")
+                    self.error(f"Invalid parameter name '{token}': expected '-{param.name}'.")
                     return
 
                 # Check if not EOL
                 if current_token_pos + 1 == len(tokens):
-                    error(f"EOL parsing error: parameter '-{param.name}' had no value.")
+                    self.error(f"EOL parsing error: parameter '-{param.name}' had no value.")
                     return
                 
                 if param.annotation == Char: # type: ignore
                     next_token = tokens[current_token_pos + 1]
 
                     if len(next_token) != 1:
-                        error(f"Invalid input: expected one character for parameter '-{param.name}' but received {len(next_token)} characters.")
+                        self.error(f"Invalid input: expected one character for parameter '-{param.name}' but received {len(next_token)} characters.")
                         return
                     
                     callback_kwargs[param.name] = next_token
@@ -129,7 +134,7 @@ class Parser:
                     try:
                         callback_kwargs[param.name] = int(next_token)
                     except ValueError:
-                        error(f"Cannot convert '{next_token}' into a base-10 integer.")
+                        self.error(f"Cannot convert '{next_token}' into a base-10 integer.")
                         return
                     
                     current_token_pos += 1
@@ -140,7 +145,7 @@ class Parser:
                     try:
                         callback_kwargs[param.name] = float(next_token)
                     except ValueError:
-                        error(f"Cannot convert '{next_token}' into a base-10 integer.")
+                        self.error(f"Cannot convert '{next_token}' into a base-10 integer.")
                         return
                     
                     current_token_pos += 1
@@ -149,7 +154,7 @@ class Parser:
             else:
                 if param.annotation == Char: # type: ignore
                     if len(token) != 1:
-                        error(f"Invalid input: expected one character for parameter '-{param.name}' but received {len(token)} characters.")
+                        self.error(f"Invalid input: expected one character for parameter '-{param.name}' but received {len(token)} characters.")
                         return
                     
                     callback_args += (token,)
@@ -173,14 +178,14 @@ class Parser:
                     try:
                         callback_args += (int(token),)
                     except ValueError:
-                        error(f"Cannot convert '{token}' into a base-10 integer.")
+                        self.error(f"Cannot convert '{token}' into a base-10 integer.")
                         return
                 
                 if param.annotation == float:
                     try:
                         callback_args += (float(token),)
                     except ValueError:
-                        error(f"Cannot convert '{token}' into a base-10 integer.")
+                        self.error(f"Cannot convert '{token}' into a base-10 integer.")
                         return
                     
                     current_token_pos += 1
@@ -206,6 +211,14 @@ class Parser:
             if from_cli.startswith('stop'):
                 break
 
-            tokens = self.collect_args(from_cli)
+            self.handle_line(from_cli)
+    
+    def handle_line(self, raw_text: str) -> None:
+        "Split up and run a single line of input, ignoring it if it's empty."
+
+        tokens = self.collect_args(raw_text)
+
+        if not tokens:
+            return
 
-            self.parse(tokens)
\ No newline at end of file
+        self.parse(tokens)
\ No newline at end of file
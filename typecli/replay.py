@@ -0,0 +1,250 @@
+from .commands import Command, CommandLookup
+from .parser import Parser
+
+from contextlib import nullcontext, redirect_stdout
+from io import StringIO
+from json import dumps, loads
+from math import ceil
+from time import perf_counter, sleep
+from typing import NamedTuple
+
+class Entry(NamedTuple):
+    "A single line of input captured from a session."
+
+    offset: float
+    "The number of seconds between the start of the session and this line being entered."
+
+    line: str
+    "The raw text that was entered."
+
+
+def save_session(entries: list[Entry], path: str, /) -> None:
+    "Write a recorded session to a file, one JSON object per line."
+
+    with open(path, 'w') as f:
+        for entry in entries:
+            f.write(dumps(entry._asdict()) + '\n')
+
+
+def load_session(path: str, /) -> list[Entry]:
+    "Read a recorded session back from a file written by `save_session`."
+
+    with open(path) as f:
+        return [
+            Entry(**loads(line))
+            for line in f
+            if line.strip()
+        ]
+
+
+class Recorder(Parser):
+    """
+    A parser that keeps track of every line entered while it runs,
+    alongside how long after the start of the session it was entered.
+
+    Each line is written to `path` as soon as it's entered, so the
+    recording survives the session ending early. Running the recorder
+    overwrites anything already at `path`. To record the CLI that's
+    built automatically, set `consts.RECORD_SESSION` to a path.
+    """
+
+    def __init__(self, path: str, commands: CommandLookup = Command.instances) -> None:
+        super().__init__(commands)
+
+        self.path = path
+        self.entries: list[Entry] = []
+        self._start = perf_counter()
+
+    def run(self) -> None:
+        # Start each recording with an empty file
+        open(self.path, 'w').close()
+
+        self.entries = []
+        self._start = perf_counter()
+
+        try:
+            super().run()
+        except (EOFError, KeyboardInterrupt):
+            pass
+
+    def handle_line(self, raw_text: str) -> None:
+        tokens = self.collect_args(raw_text)
+
+        if not tokens:
+            return
+
+        # Write the line out before running it, in case it crashes
+        entry = Entry(perf_counter() - self._start, raw_text)
+        self.entries.append(entry)
+
+        with open(self.path, 'a') as f:
+            f.write(dumps(entry._asdict()) + '\n')
+
+        self.parse(tokens)
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    "Get the nearest-rank percentile of an already sorted list."
+
+    rank = max(1, ceil(pct / 100 * len(ordered)))
+
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class Report:
+    """
+    The results of replaying a session.
+
+    Converting this to a string gives a table that is sorted by
+    command name, so the reports of two runs can be diffed.
+    """
+
+    PERCENTILES: tuple[int, ...] = (50, 90, 99)
+
+    def __init__(self, latencies: dict[str, list[float]], errors: dict[str, int], elapsed: float) -> None:
+        self.latencies = latencies
+        self.errors = errors
+        self.elapsed = elapsed
+
+    @property
+    def total(self) -> int:
+        "The number of lines that were replayed."
+
+        return sum(len(times) for times in self.latencies.values())
+
+    @property
+    def throughput(self) -> float:
+        "The number of lines replayed per second."
+
+        if not self.elapsed:
+            return 0.0
+
+        return self.total / self.elapsed
+
+    def percentiles(self, name: str) -> dict[int, float]:
+        "Get the latency percentiles, in seconds, of the command with the given name."
+
+        ordered = sorted(self.latencies[name])
+
+        return {
+            pct: _percentile(ordered, pct)
+            for pct in self.PERCENTILES
+        }
+
+    def __str__(self) -> str:
+        header = f"{'command':<16} {'count':>8} {'errors':>8}" + ''.join(
+            f" {f'p{pct} (ms)':>12}" for pct in self.PERCENTILES
+        )
+
+        lines = [
+            f"total: {self.total} lines in {self.elapsed:.3f}s ({self.throughput:.1f} lines/s), {sum(self.errors.values())} errors",
+            "",
+            header
+        ]
+
+        for name in sorted(self.latencies):
+            row = f"{name:<16} {len(self.latencies[name]):>8} {self.errors.get(name, 0):>8}" + ''.join(
+                f" {value * 1000:>12.3f}"
+                for value in self.percentiles(name).values()
+            )
+
+            lines.append(row)
+
+        return '\n'.join(lines)
+
+    def save(self, path: str, /) -> None:
+        "Write the report to a file."
+
+        with open(path, 'w') as f:
+            f.write(str(self) + '\n')
+
+
+class Replayer(Parser):
+    """
+    A parser that feeds a recorded session back through `collect_args`
+    and `parse`, timing how long each line takes.
+
+    To stand in for commands that touch external services, create
+    stubs with `register = False`, add them to a new `CommandLookup`
+    and pass that in instead.
+    """
+
+    _failed: bool = False
+
+    def replay(self, entries: list[Entry], *, speed: float | None = 1.0, quiet: bool = True) -> Report:
+        """
+        Replay the given entries and report on how long they took.
+
+        `speed` scales the gaps between lines: `1.0` is the original
+        speed, `2.0` is twice as fast, and `None` replays every line
+        as fast as possible.
+
+        If `quiet` is set, anything printed by commands is discarded.
+
+        A line that raises an exception or is rejected by the parser,
+        such as one naming an unknown command, is still timed, and is
+        counted as an error against its command.
+        """
+
+        if speed is not None and speed <= 0:
+            raise ValueError(f"speed must be positive, not {speed}.")
+
+        latencies: dict[str, list[float]] = {}
+        errors: dict[str, int] = {}
+        out = StringIO()
+
+        start = perf_counter()
+
+        with redirect_stdout(out) if quiet else nullcontext():
+            for entry in entries:
+                if speed is not None:
+                    delay = start + entry.offset / speed - perf_counter()
+
+                    if delay > 0:
+                        sleep(delay)
+
+                tokens: list[str] = []
+                self._failed = False
+
+                began = perf_counter()
+
+                try:
+                    tokens = self.collect_args(entry.line)
+
+                    if tokens:
+                        self.parse(tokens)
+                except Exception:
+                    self._failed = True
+
+                taken = perf_counter() - began
+                failed = self._failed
+
+                out.seek(0)
+                out.truncate()
+
+                if not tokens and not failed:
+                    continue
+
+                name = self._command_name(tokens or entry.line.split() or [entry.line])
+
+                latencies.setdefault(name, []).append(taken)
+
+                if failed:
+                    errors[name] = errors.get(name, 0) + 1
+
+        return Report(latencies, errors, perf_counter() - start)
+
+    def error(self, message: str, /) -> None:
+        self._failed = True
+
+        super().error(message)
+
+    def _command_name(self, tokens: list[str]) -> str:
+        "Get the name to report a line under, grouping aliases under the command's real name."
+
+        command = self._commands.get(tokens[0])
+
+        if command and command.name:
+            return command.name
+
+        return tokens[0]